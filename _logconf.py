@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+_logconf.py
+
+Logging setup for the command-line entry point. The builder modules only create
+their loggers with logging.getLogger(__name__), so importing them as a library
+leaves the host application's logging alone; main.py installs the console
+handler on the root logger once per process.
+"""
+
+import logging
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_configured = False
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Install the console handler on the root logger unless one already exists."""
+    global _configured
+    if _configured:
+        return
+    _configured = True
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=level, format=LOG_FORMAT, datefmt=DATE_FORMAT)
@@ -14,22 +14,175 @@ Enhancements:
  - Uses Graphviz's unflatten tool to dynamically adjust layout,
    preventing overly zoomed-out diagrams.
  - Removes any fixed 'size' or 'ratio' from the YAML to let code handle layout.
- - Unbinds final_dot.filename after loading from unflattened file to avoid
-   the "No such file or directory" error when rendering to a different filename.
+ - Unflattens the DOT source in memory via graphviz.unflatten() instead of
+   round-tripping through intermediate .gv files.
 """
 
-import graphviz
-import yaml
-import logging
 import subprocess
-import os
-from typing import Dict, Any, List, Optional
+import copy
+import functools
+import hashlib
+import json
+import logging
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
+
+if TYPE_CHECKING:
+    import graphviz
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
-def create_clusters(parent: graphviz.Digraph, clusters_config: List[Dict[str, Any]]) -> None:
+# Title styling used when the YAML does not define 'title_attributes'
+_DEFAULT_TITLE_ATTRIBUTES = {
+    'labelloc': 't',
+    'fontsize': '16',
+    'fontname': 'Arial'
+}
+
+
+def _load_config(yaml_file: str, buf: bytes, digest: str) -> Dict[str, Any]:
+    """
+    Parse a YAML configuration, preferring a matching JSON sidecar when one exists.
+
+    The sidecar lives next to the YAML file as '<yaml_file>.cache.json' and records
+    the digest of the YAML contents it was built from; it is only used when that
+    digest matches, so timestamps play no part. Otherwise the YAML is parsed and
+    the sidecar is rewritten on a best-effort basis (e.g. read-only directories are
+    silently skipped).
+
+    Args:
+        yaml_file (str): Path to the YAML configuration file.
+        buf (bytes): Raw contents of the YAML configuration file.
+        digest (str): Hex digest of buf.
+
+    Returns:
+        Dict[str, Any]: The parsed configuration.
+    """
+    cache_path = yaml_file + ".cache.json"
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = orjson.loads(f.read()) if orjson else json.load(f)
+        if isinstance(cached, dict) and cached.get('digest') == digest and 'config' in cached:
+            logger.debug("Loaded configuration from JSON sidecar '%s'.", cache_path)
+            return cached['config']
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.debug("Ignoring unreadable JSON sidecar '%s': %s", cache_path, e)
+
+    # Imported lazily so importing this module does not pay for PyYAML
+    import yaml
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+    config = yaml.load(buf, Loader=SafeLoader)
+
+    try:
+        cached = {'digest': digest, 'config': config}
+        if orjson:
+            data = orjson.dumps(cached)
+        else:
+            data = json.dumps(cached).encode('utf-8')
+        with open(cache_path, 'wb') as f:
+            f.write(data)
+        logger.debug("Wrote JSON sidecar '%s'.", cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Could not write JSON sidecar '%s': %s", cache_path, e)
+    return config
+
+
+class _YamlSource:
+    """Raw contents of a YAML file that hash and compare by their BLAKE2b digest."""
+    __slots__ = ('path', 'buf', 'digest')
+
+    def __init__(self, path: str, buf: bytes):
+        self.path = path
+        self.buf = buf
+        self.digest = hashlib.blake2b(buf, digest_size=16).digest()
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _YamlSource) and self.digest == other.digest
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_yaml_by_hash(source: _YamlSource) -> Dict[str, Any]:
+    """Parse a YAML source; results are memoized by the digest of its contents."""
+    return _load_config(source.path, source.buf, source.digest.hex())
+
+
+def _load_yaml_cached(yaml_file: str) -> Dict[str, Any]:
+    """
+    Load a YAML configuration file, reusing the parsed result while its contents are unchanged.
+
+    Results are memoized by a digest of the file contents rather than its modification
+    time, both in memory and in the JSON sidecar (see _load_config), so editors or
+    checkouts that preserve timestamps cannot serve a stale configuration.
+
+    Args:
+        yaml_file (str): Path to the YAML configuration file.
+
+    Returns:
+        Dict[str, Any]: A deep copy of the parsed configuration, so callers may
+        mutate it without corrupting the cache.
     """
-    Recursively create clusters (subgraphs) as defined in the 'clusters' section of the YAML.
+    with open(yaml_file, 'rb') as f:
+        buf = f.read()
+    return copy.deepcopy(_parse_yaml_by_hash(_YamlSource(yaml_file, buf)))
+
+
+def add_nodes(graph: 'graphviz.Digraph', nodes_config: List[Dict[str, Any]],
+              cluster_name: Optional[str] = None) -> None:
+    """
+    Add the nodes defined in a 'nodes' section of the YAML to a graph or cluster.
+    
+    Args:
+        graph (graphviz.Digraph): The graph or subgraph that receives the nodes.
+        nodes_config (List[Dict[str, Any]]): A list of node definitions, each containing:
+            - id (str): The Graphviz node ID.
+            - name (str): The node label (optional).
+            - attributes (dict): Graphviz node attributes (optional).
+        cluster_name (Optional[str]): Name of the enclosing cluster, or None for
+            top-level nodes. Only used for log messages.
+    
+    The node statements are formatted with graphviz's own quoting helpers and
+    appended to the graph body in one batch, producing the same DOT source as
+    one graph.node() call per node.
+    """
+    from graphviz.quoting import attr_list, quote
+
+    lines = []
+    for node in nodes_config:
+        node_id = node.get('id')
+        node_name = node.get('name', '')
+        node_attrs = node.get('attributes', {})
+        if not node_id:
+            if cluster_name is None:
+                logger.warning("A top-level node is missing 'id'; skipping.")
+            else:
+                logger.warning(f"Node in cluster '{cluster_name}' has no 'id' field; skipping.")
+            continue
+        if cluster_name is None:
+            logger.debug("Adding top-level node '%s'.", node_id)
+        else:
+            logger.debug("Adding node '%s' to cluster '%s'.", node_id, cluster_name)
+        lines.append(f"\t{quote(node_id)}{attr_list(node_name, kwargs=node_attrs)}\n")
+    graph.body.extend(lines)
+
+
+def create_clusters(parent: 'graphviz.Digraph', clusters_config: List[Dict[str, Any]]) -> None:
+    """
+    Create clusters (subgraphs) as defined in the 'clusters' section of the YAML.
+    Nested clusters are walked with an explicit stack instead of recursion, so deep
+    hierarchies neither pay per-level call overhead nor hit the recursion limit.
     
     Args:
         parent (graphviz.Digraph): The parent graph or subgraph in which to create clusters.
@@ -39,56 +192,68 @@ def create_clusters(parent: graphviz.Digraph, clusters_config: List[Dict[str, An
             - subgraphs (List[Dict[str, Any]]): Nested cluster definitions (optional).
             - nodes (List[Dict[str, Any]]): Nodes to create inside this cluster (optional).
     """
-    for cluster in clusters_config:
+    # Entries are (graph, cluster, subgraph). A cluster is first visited with
+    # subgraph=None to create it and queue its nested clusters; it is visited again
+    # once those are done to add its nodes and attach it to the enclosing graph.
+    # This keeps the DOT output identical to the nested 'with' blocks it replaces.
+    stack = [(parent, cluster, None) for cluster in reversed(clusters_config)]
+    while stack:
+        graph, cluster, sub = stack.pop()
         cluster_name = cluster.get('name')
+
+        if sub is not None:
+            # Create nodes inside this cluster, then attach it to its parent
+            add_nodes(sub, cluster.get('nodes', []), cluster_name)
+            graph.subgraph(sub)
+            continue
+
         if not cluster_name:
             logger.warning("Encountered a cluster without a 'name' field; skipping.")
             continue
         
         # Create a subgraph named 'cluster_<name>' to follow Graphviz's cluster naming convention
         subgraph_id = f"cluster_{cluster_name}"
-        logger.debug(f"Creating subgraph: {subgraph_id}")
-        
-        with parent.subgraph(name=subgraph_id) as sub:
-            # Apply the cluster's graph attributes
-            attrs = cluster.get('attributes', {})
-            sub.attr(**attrs)
-
-            # Recursively handle nested subgraphs if present
-            nested_subgraphs = cluster.get('subgraphs', [])
-            if nested_subgraphs:
-                logger.debug(f"Cluster '{cluster_name}' has {len(nested_subgraphs)} nested subgraphs.")
-                create_clusters(sub, nested_subgraphs)
-
-            # Create nodes inside this cluster
-            cluster_nodes = cluster.get('nodes', [])
-            for node in cluster_nodes:
-                node_id = node.get('id')
-                node_name = node.get('name', '')
-                node_attrs = node.get('attributes', {})
-                if not node_id:
-                    logger.warning(f"Node in cluster '{cluster_name}' has no 'id' field; skipping.")
-                    continue
-                logger.debug(f"Adding node '{node_id}' to cluster '{cluster_name}'.")
-                sub.node(node_id, node_name, **node_attrs)
-
-
-def run_unflatten(input_gv: str, output_gv: str, max_depth: int = 3) -> None:
+        logger.debug("Creating subgraph: %s", subgraph_id)
+        sub = type(graph)(name=subgraph_id)
+
+        # Apply the cluster's graph attributes
+        attrs = cluster.get('attributes', {})
+        sub.attr(**attrs)
+
+        # Revisit this cluster after its nested subgraphs have been created
+        stack.append((graph, cluster, sub))
+        nested_subgraphs = cluster.get('subgraphs', [])
+        if nested_subgraphs:
+            logger.debug("Cluster '%s' has %s nested subgraphs.", cluster_name, len(nested_subgraphs))
+            stack.extend((sub, nested, None) for nested in reversed(nested_subgraphs))
+
+
+def render_formats(source: str, output_file: str, formats: List[str]) -> List[str]:
     """
-    Runs the 'unflatten' tool to improve the layout of a Graphviz .gv file.
-    This helps avoid overly wide or zoomed-out diagrams by balancing rank layers.
+    Render DOT source to several output formats with a single 'dot' invocation.
+    Passing one -T flag per format lets dot run the (expensive) layout only once.
     
     Args:
-        input_gv (str): Path to the original .gv file.
-        output_gv (str): Path to the output .gv file after unflatten.
-        max_depth (int): Maximum depth for unflatten layering (-l).
+        source (str): The DOT source to render.
+        output_file (str): Base name of the output files (without extension).
+        formats (List[str]): Output formats, e.g. ['pdf', 'png'].
+    
+    Returns:
+        List[str]: Paths of the generated files, in the order of formats.
     """
-    logger.debug(f"Running unflatten on '{input_gv}' -> '{output_gv}' with max_depth={max_depth}")
-    # Requires Graphviz to be installed and 'unflatten' available in PATH
-    subprocess.run(
-        ["unflatten", f"-l{max_depth}", "-f", "-o", output_gv, input_gv],
-        check=True
-    )
+    if not formats:
+        return []
+
+    # Each -o binds to the -T flag before it; the source is fed on stdin so no
+    # intermediate .gv file is written
+    cmd = ["dot"]
+    outpaths = []
+    for fmt in formats:
+        outpath = f"{output_file}.{fmt}"
+        cmd += [f"-T{fmt}", f"-o{outpath}"]
+        outpaths.append(outpath)
+    subprocess.run(cmd, input=source.encode('utf-8'), check=True)
+    return outpaths
 
 
 def create_block_diagram(yaml_file: str, output_file: str = "block_diagram") -> None:
@@ -103,10 +268,11 @@ def create_block_diagram(yaml_file: str, output_file: str = "block_diagram") ->
     Raises:
         Exception: If there is any error in loading or processing the YAML configuration.
     """
+    import graphviz
+
     try:
         # Load block diagram configuration from YAML
-        with open(yaml_file, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml_cached(yaml_file)
         logger.info("YAML configuration loaded successfully.")
 
         # Create a new directed graph with configurable attributes
@@ -115,87 +281,66 @@ def create_block_diagram(yaml_file: str, output_file: str = "block_diagram") ->
 
         # Apply global graph attributes from config
         graph_attrs = config.get('graph_attributes', {})
+        # Scalar values are plain graph attributes and go out in a single call;
+        # dict values hold 'graph'/'node'/'edge' attribute statements
+        scalar_attrs = {key: str(value) for key, value in graph_attrs.items()
+                        if not isinstance(value, dict)}
+        if scalar_attrs:
+            dot.attr(**scalar_attrs)
         for key, value in graph_attrs.items():
             if isinstance(value, dict):
                 dot.attr(key, **value)
-            else:
-                dot.attr(key, str(value))
         logger.debug("Applied global graph attributes.")
 
         # Add title if specified
         if 'title' in config:
-            title_attrs = config.get('title_attributes', {
-                'labelloc': 't',
-                'fontsize': '16',
-                'fontname': 'Arial'
-            })
+            title_attrs = config.get('title_attributes', _DEFAULT_TITLE_ATTRIBUTES)
             title_text = f"{config['title']}\n{config.get('description', '')}"
             dot.attr('graph', **title_attrs)
             dot.attr('graph', label=title_text)
-            logger.debug(f"Applied title attributes and set title to '{title_text}'.")
+            logger.debug("Applied title attributes and set title to '%s'.", title_text)
 
         # Create the top-level clusters/subgraphs
         clusters_config = config.get('clusters', [])
         if clusters_config:
-            logger.debug(f"Found {len(clusters_config)} top-level clusters. Creating subgraphs.")
+            logger.debug("Found %s top-level clusters. Creating subgraphs.", len(clusters_config))
             create_clusters(dot, clusters_config)
         else:
             logger.debug("No top-level clusters found in the configuration.")
 
         # Create any top-level nodes (not in a cluster)
         if 'nodes' in config:
-            for node in config['nodes']:
-                node_id = node.get('id')
-                node_name = node.get('name', '')
-                node_attrs = node.get('attributes', {})
-                if not node_id:
-                    logger.warning("A top-level node is missing 'id'; skipping.")
-                    continue
-                logger.debug(f"Adding top-level node '{node_id}'.")
-                dot.node(node_id, node_name, **node_attrs)
-
-        # Add connections (edges) with configurable styling
+            add_nodes(dot, config['nodes'])
+
+        # Add connections (edges) with configurable styling; the edge statements
+        # are formatted as dot.edge() would and appended in one batch
+        from graphviz.quoting import attr_list, quote_edge
+
+        edge_lines = []
         for connection in config.get('connections', []):
-            edge_attrs = connection.get('attributes', {}).copy()
             from_node = connection.get('from')
             to_node = connection.get('to')
             if not from_node or not to_node:
                 logger.warning("A connection is missing 'from' or 'to'; skipping.")
                 continue
             label = connection.get('label', '')
-            logger.debug(f"Creating edge from '{from_node}' to '{to_node}' with label '{label}'.")
-            dot.edge(from_node, to_node, xlabel=label, **edge_attrs)
-
-        # 1) Save the raw .gv file
-        gv_file = output_file + ".gv"
-        dot.save(gv_file)
-        logger.info(f"Saved raw .gv file: {gv_file}")
-
-        # 2) Run unflatten to improve the layout dynamically
-        unflat_file = output_file + "_unflat.gv"
-        run_unflatten(gv_file, unflat_file, max_depth=3)
-
-        # 3) Load the unflattened .gv file
-        final_dot = graphviz.Source.from_file(unflat_file)
-
-        # 4) Set directory and filename for rendering
-        # Create a new Source object to avoid file existence checks
-        dot_content = final_dot.source
-        render_dot = graphviz.Source(dot_content)
-        render_dot.directory = "."  # Always render in current directory
-        
-        # 5) Render in all requested formats
+            logger.debug("Creating edge from '%s' to '%s' with label '%s'.", from_node, to_node, label)
+            # dict(**...) rejects a duplicate 'xlabel' just as dot.edge() did
+            edge_attrs = dict(xlabel=label, **connection.get('attributes', {}))
+            edge_lines.append(f"\t{quote_edge(from_node)} -> {quote_edge(to_node)}"
+                              f"{attr_list(kwargs=edge_attrs)}\n")
+        dot.body.extend(edge_lines)
+
+        # 1) Run unflatten to improve the layout dynamically; this pipes the DOT
+        #    source through Graphviz's unflatten without intermediate .gv files
+        unflat_source = graphviz.unflatten(dot.source, stagger=3, fanout=True)
+        logger.debug("Applied unflatten to the generated DOT source.")
+
+        # 2) Render all requested formats with a single dot invocation
         output_formats = config.get('output_formats', ['pdf', 'png'])
-        for fmt in output_formats:
-            render_dot.format = fmt
-            outpath = render_dot.render(filename=output_file, cleanup=True)
+        for outpath in render_formats(unflat_source, output_file, output_formats):
             logger.info(f"Successfully generated '{outpath}' with unflattened layout.")
 
-        # Clean up intermediate .gv files
-        os.remove(gv_file)
-        os.remove(unflat_file)
-        logger.debug("Cleaned up intermediate .gv files")
-
     except Exception as e:
         logger.error(f"Error generating block diagram: {e}")
         raise
@@ -12,43 +12,104 @@ Date: 2024-02-10
 
 import logging
 import sys
-import argparse
-from pm_matrix_builder import create_wbs_and_ram
-from block_diagram_builder import create_block_diagram
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(name)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+from types import SimpleNamespace
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from _logconf import configure_logging
+
 logger = logging.getLogger(__name__)
 
-def main():
+# Command-line flags and options understood by the fast path in parse_args
+_FLAGS = ('--wbs', '--ram', '--block')
+_OPTIONS = {
+    '--wbs-yaml': 'wbs_structure.yaml',
+    '--block-yaml': 'block_diagram.yaml'
+}
+
+def build_parser():
+    """Build the full argparse parser, used for --help and anything unusual."""
+    import argparse
+
     parser = argparse.ArgumentParser(description='Generate project management diagrams.')
     parser.add_argument('--wbs', action='store_true', help='Generate WBS diagram')
     parser.add_argument('--ram', action='store_true', help='Generate RAM diagram')
     parser.add_argument('--block', action='store_true', help='Generate block diagram')
     parser.add_argument('--wbs-yaml', default='wbs_structure.yaml', help='WBS YAML file (default: wbs_structure.yaml)')
     parser.add_argument('--block-yaml', default='block_diagram.yaml', help='Block diagram YAML file (default: block_diagram.yaml)')
+    return parser
+
+def parse_args(argv=None):
+    """
+    Parse command-line arguments.
     
-    args = parser.parse_args()
+    Plain flags and '--opt value' / '--opt=value' options are handled by hand;
+    anything else (--help, abbreviations, missing values, unknown arguments)
+    is handed to argparse so usage and error messages stay the same.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    args = {flag[2:]: False for flag in _FLAGS}
+    args.update((opt[2:].replace('-', '_'), default) for opt, default in _OPTIONS.items())
+
+    i = 0
+    while i < len(argv):
+        name, eq, value = argv[i].partition('=')
+        if name in _FLAGS and not eq:
+            args[name[2:]] = True
+        elif name in _OPTIONS:
+            if not eq:
+                i += 1
+                if i == len(argv) or argv[i].startswith('-'):
+                    return build_parser().parse_args(argv)
+                value = argv[i]
+            args[name[2:].replace('-', '_')] = value
+        else:
+            return build_parser().parse_args(argv)
+        i += 1
+    return SimpleNamespace(**args)
+
+def report_success(name):
+    """Log the outputs of a finished build, "wbs" or "block"."""
+    if name == "wbs":
+        logger.info("Successfully generated WBS and RAM diagrams")
+        logger.info(f"- WBS diagram saved as: wbs_output.pdf")
+        logger.info(f"- RAM diagram saved as: ram_output.pdf")
+    else:
+        logger.info("Successfully generated block diagram")
+        logger.info(f"- Block diagram saved as: block_diagram.pdf")
+
+def main():
+    configure_logging()
+    args = parse_args()
     
     # If no specific diagrams are requested, generate all
     if not (args.wbs or args.ram or args.block):
         args.wbs = args.ram = args.block = True
     
+    # Import the builders only once the arguments are known to be valid, so
+    # --help and usage errors do not pay for graphviz, yaml and pandas
+    from pm_matrix_builder import create_wbs_and_ram
+    from block_diagram_builder import create_block_diagram
+
+    # The WBS/RAM and block diagram builds are independent, so run them in
+    # separate processes and report each one as it finishes. Workers set up
+    # logging themselves in case they are spawned rather than forked. A single
+    # build runs in this process, since a worker would only add startup cost.
+    jobs = []
+    if args.wbs or args.ram:
+        jobs.append(("wbs", create_wbs_and_ram, args.wbs_yaml))
+    if args.block:
+        jobs.append(("block", create_block_diagram, args.block_yaml))
+
     try:
-        if args.wbs or args.ram:
-            create_wbs_and_ram(args.wbs_yaml)
-            logger.info("Successfully generated WBS and RAM diagrams")
-            logger.info(f"- WBS diagram saved as: wbs_output.pdf")
-            logger.info(f"- RAM diagram saved as: ram_output.pdf")
-        
-        if args.block:
-            create_block_diagram(args.block_yaml)
-            logger.info("Successfully generated block diagram")
-            logger.info(f"- Block diagram saved as: block_diagram.pdf")
+        if len(jobs) == 1:
+            name, func, yaml_file = jobs[0]
+            func(yaml_file)
+            report_success(name)
+        else:
+            with ProcessPoolExecutor(max_workers=len(jobs), initializer=configure_logging) as executor:
+                futures = {executor.submit(func, yaml_file): name for name, func, yaml_file in jobs}
+                for future in as_completed(futures):
+                    future.result()
+                    report_success(futures[future])
             
     except Exception as e:
         logger.error(f"Error generating diagrams: {e}", exc_info=True)
@@ -10,27 +10,23 @@ Author: Brighton Sikarskie
 Date: 2025-01-29
 """
 
+import functools
+import hashlib
+import itertools
+import json
 import logging
+import os
 import re
-from graphviz import Digraph
-import yaml
-from typing import Dict, List, Union, Tuple, Any
-import pandas as pd
-import openpyxl
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Union, Tuple, Any, Iterable, Iterator, Sequence
 
-# Configure module-level logger
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+if TYPE_CHECKING:
+    from graphviz import Digraph
 
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
-formatter = logging.Formatter(
-    fmt="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S"
-)
-if not logger.handlers:
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+logger = logging.getLogger(__name__)
 
 def load_wbs_from_yaml(yaml_file: str) -> Dict:
     """
@@ -42,18 +38,113 @@ def load_wbs_from_yaml(yaml_file: str) -> Dict:
     Returns:
         Dictionary containing the parsed WBS structure
     """
+    # yaml is only needed here, so importing this module and cache hits in
+    # _load_or_build_wbs do not pay for it
+    import yaml
+
+    # PyYAML may be built without libyaml, which provides CSafeLoader
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
     logger.info(f"Loading WBS structure from {yaml_file}")
     try:
-        with open(yaml_file, 'r') as f:
-            wbs_data = yaml.safe_load(f)
+        # libyaml parses the raw bytes, detecting the encoding itself
+        with open(yaml_file, 'rb') as f:
+            wbs_data = yaml.load(f, Loader=loader)
         return wbs_data
     except Exception as e:
         logger.error(f"Error loading YAML file: {e}", exc_info=True)
         raise
 
+# RAM attributes that together mark a WBS leaf (work package)
+_LEAF_KEYS = frozenset({'responsibilities', 'duration', 'labor'})
+
 def is_leaf_node(item: Dict) -> bool:
     """Check if an item is a leaf node with RAM attributes."""
-    return isinstance(item, dict) and 'responsibilities' in item and 'duration' in item and 'labor' in item
+    return isinstance(item, dict) and _LEAF_KEYS <= item.keys()
+
+_WBS_METADATA_FIELDS = frozenset({'type', 'responsibilities', 'duration', 'labor', 'wbs_number', 'name'})
+
+def _wbs_child_entries(items: Any) -> List[Tuple[str, Any]]:
+    """Return the (name, items) pairs that convert_yaml_to_wbs_format descends into."""
+    if not items or is_leaf_node(items):
+        return []
+    if isinstance(items, list):
+        return [(child_name, child_items)
+                for item in items if isinstance(item, dict)
+                for child_name, child_items in item.items()]
+    if isinstance(items, dict):
+        return [(child_name, child_items)
+                for child_name, child_items in items.items()
+                if child_name not in _WBS_METADATA_FIELDS and isinstance(child_items, dict)]
+    return []
+
+def _collapse_single_children(entries: List[Tuple[str, Any]], results: Dict[int, List]) -> List[Tuple[str, List]]:
+    """
+    Keep children of multi-child parents and leaves; splice single non-leaf children upward.
+    
+    Done in one pass: the first valid child is held back until a second one
+    shows up, so the single-child case is decided without a second loop.
+    """
+    result = []
+    first = None
+    count = 0
+    for child_name, child_items in entries:
+        child_result = results[id(child_items)]
+        # Entries only hold dict children, so the leaf test is inlined
+        is_leaf = _LEAF_KEYS <= child_items.keys()
+        if not (child_result or is_leaf):
+            continue
+        count += 1
+        if count == 1:
+            first = (child_name, child_result, is_leaf)
+            continue
+        if count == 2:
+            # Parent has multiple children: keep every one of them
+            result.append(first[:2])
+        result.append((child_name, child_result))
+
+    if count == 1:
+        child_name, child_result, is_leaf = first
+        if is_leaf:
+            # Keep a lone child if it's a leaf
+            result.append((child_name, child_result))
+        else:
+            # Skip single-child nodes by adding their children directly
+            result.extend(child_result)
+    return result
+
+def _process_wbs_items(roots: List[Any]) -> Dict[int, List[Tuple[str, List]]]:
+    """
+    Convert every subtree under ``roots`` bottom-up with an explicit stack.
+
+    Each node is visited twice: once to push its children, and again once all
+    of their results are available. Results are keyed by ``id()`` of the YAML
+    node, which stays alive for the duration of the walk.
+    """
+    # Entries are (node, child entries); the entries are None on the first
+    # visit and are kept on the frame for the second one
+    results: Dict[int, List[Tuple[str, List]]] = {}
+    stack = [(node, None) for node in reversed(roots)]
+    while stack:
+        items, entries = stack.pop()
+        if id(items) in results:
+            continue
+        if entries is None:
+            entries = _wbs_child_entries(items)
+            stack.append((items, entries))
+            stack.extend((child_items, None) for _, child_items in reversed(entries))
+            continue
+
+        if isinstance(items, list):
+            result = []
+            for child_name, child_items in entries:
+                child_result = results[id(child_items)]
+                if child_result or is_leaf_node(child_items):
+                    result.append((child_name, child_result))
+        else:
+            result = _collapse_single_children(entries, results)
+        results[id(items)] = result
+    return results
 
 def convert_yaml_to_wbs_format(yaml_data: Dict) -> Dict[str, List[Tuple[str, List]]]:
     """
@@ -65,74 +156,17 @@ def convert_yaml_to_wbs_format(yaml_data: Dict) -> Dict[str, List[Tuple[str, Lis
     Returns:
         Dictionary in WBS format with (name, children) tuples
     """
-    def process_item(name: str, items: Any) -> List[Tuple[str, List]]:
-        if not items:
-            return []
-        
-        # If this is a leaf node with RAM attributes, return empty list
-        if is_leaf_node(items):
-            return []
-
-        result = []
-        if isinstance(items, list):
-            # Handle list of items
-            for item in items:
-                if isinstance(item, dict):
-                    for child_name, child_items in item.items():
-                        child_result = process_item(child_name, child_items)
-                        if child_result or is_leaf_node(child_items):
-                            result.append((child_name, child_result))
-        elif isinstance(items, dict):
-            # Handle dictionary items, excluding metadata fields
-            metadata_fields = {'type', 'responsibilities', 'duration', 'labor', 'wbs_number', 'name'}
-            valid_children = []
-            
-            # First, collect all valid children
-            for child_name, child_items in items.items():
-                if child_name not in metadata_fields and isinstance(child_items, dict):
-                    child_result = process_item(child_name, child_items)
-                    if child_result or is_leaf_node(child_items):
-                        valid_children.append((child_name, child_items, child_result))
-            
-            # Process children based on count
-            for child_name, child_items, child_result in valid_children:
-                if len(valid_children) >= 2 or is_leaf_node(child_items):
-                    # Keep this node if parent has multiple children or if it's a leaf
-                    result.append((child_name, child_result))
-                else:
-                    # Skip single-child nodes by adding their children directly
-                    result.extend(child_result)
-
-        return result
-
-    # Process the root level
     result = {}
     for root_name, root_items in yaml_data.items():
         if isinstance(root_items, dict):
             # Get project name from the name tag if it exists
             project_name = root_items.get('name', root_name)
             # Exclude metadata fields at root level
-            metadata_fields = {'type', 'responsibilities', 'duration', 'labor', 'wbs_number', 'name'}
-            children = []
-            valid_children = []
-            
-            # First, collect all valid children
-            for child_name, child_items in root_items.items():
-                if child_name not in metadata_fields and isinstance(child_items, dict):
-                    child_result = process_item(child_name, child_items)
-                    if child_result or is_leaf_node(child_items):
-                        valid_children.append((child_name, child_items, child_result))
-            
-            # Process children based on count
-            for child_name, child_items, child_result in valid_children:
-                if len(valid_children) >= 2 or is_leaf_node(child_items):
-                    # Keep this node if parent has multiple children or if it's a leaf
-                    children.append((child_name, child_result))
-                else:
-                    # Skip single-child nodes by adding their children directly
-                    children.extend(child_result)
-            
-            result[project_name] = children
+            entries = [(child_name, child_items)
+                       for child_name, child_items in root_items.items()
+                       if child_name not in _WBS_METADATA_FIELDS and isinstance(child_items, dict)]
+            results = _process_wbs_items([child_items for _, child_items in entries])
+            result[project_name] = _collapse_single_children(entries, results)
     
     return result
 
@@ -153,9 +187,8 @@ def create_wbs_from_yaml(
         graph_direction: Direction of the graph ("TB" for top-bottom, "LR" for left-right)
         colors: Optional color scheme for different levels
     """
-    yaml_data = load_wbs_from_yaml(yaml_file)
-    wbs_structure = convert_yaml_to_wbs_format(yaml_data)
-    create_wbs_diagram(wbs_structure, output_filename, file_format, graph_direction, colors)
+    flat_wbs = _load_or_build_wbs(yaml_file)
+    _create_wbs_diagram_flat(flat_wbs, output_filename, file_format, graph_direction, colors)
 
 class WBSColors:
     """Color schemes for WBS diagrams."""
@@ -169,59 +202,195 @@ class WBSColors:
         6: "#fb4934",  # Red
         7: "#fabd2f"   # Bright Yellow
     }
+    # DEFAULT as an immutable tuple indexed by level, built once per process
+    PALETTE = tuple(DEFAULT.values())
+
+# Style shared by every parent -> child edge in the WBS diagram
+_WBS_EDGE_STYLE = {
+    "color": "#3c3836",  # Gruvbox dark0
+    "arrowsize": "0.6",
+    "penwidth": "1.0"
+}
+
+# Node (width, height, fontsize) per level, already in DOT string form
+_LEVEL_DIMENSIONS = {
+    0: ("0.8", "0.3", "12"),   # Root node
+    1: ("0.7", "0.3", "11"),   # Phase nodes
+    2: ("0.6", "0.25", "10"),  # Activity nodes
+    3: ("0.5", "0.25", "9"),   # Task nodes
+    4: ("0.4", "0.2", "9"),    # Subtask nodes
+    5: ("0.4", "0.2", "8"),
+    6: ("0.3", "0.2", "8"),
+    7: ("0.3", "0.2", "8")
+}
+_DEEP_LEVEL_DIMENSIONS = ("0.3", "0.2", "8")
+
+_UNSAFE_ID_RE = re.compile(r"[^a-zA-Z0-9_]")
 
+@functools.lru_cache(maxsize=4096)
 def _safe_node_id(label: str) -> str:
     """Convert a label into a safe node ID (no spaces, punctuation)."""
-    return re.sub(r"[^a-zA-Z0-9_]", "_", label)
+    # Labels with nothing to replace skip building a new string; for the rest
+    # the search stops at the first unsafe character, so it costs little
+    if _UNSAFE_ID_RE.search(label) is None:
+        return label
+    return _UNSAFE_ID_RE.sub("_", label)
 
-def _node_style_for(label: str, level: int = 0, colors: dict = None) -> dict:
+def _palette_for(colors: Union[dict, Sequence[str], None] = None) -> Tuple[str, ...]:
+    """
+    Convert a level -> color mapping into a tuple indexed by level.
+    colors: Optional dictionary mapping levels to colors, or an already built palette
+    """
+    if colors is None or colors is WBSColors.DEFAULT:
+        return WBSColors.PALETTE
+    if isinstance(colors, dict):
+        return tuple(colors.get(level, "#fbf1c7") for level in range(len(colors)))
+    return tuple(colors)
+
+def _node_style_for(level: int = 0, colors: Union[dict, Sequence[str], None] = None) -> dict:
     """
     Returns style dict for a node.
     level: 0 for root, 1 for first level, 2 for second level, 3+ for deeper levels
-    colors: Optional dictionary mapping levels to colors
-    """
-    if colors is None:
-        colors = WBSColors.DEFAULT
-
-    # Adjust size based on level
-    sizes = {
-        0: ("0.8", "0.3"),   # Root node
-        1: ("0.7", "0.3"),   # Phase nodes
-        2: ("0.6", "0.25"),  # Activity nodes
-        3: ("0.5", "0.25"),  # Task nodes
-        4: ("0.4", "0.2"),   # Subtask nodes
-        5: ("0.4", "0.2"),
-        6: ("0.3", "0.2"),
-        7: ("0.3", "0.2")
-    }
-    width, height = sizes.get(level, ("0.3", "0.2"))
-    
-    # Adjust font size based on level
-    font_sizes = {
-        0: "12",  # Root
-        1: "11",  # Phases
-        2: "10",  # Activities
-        3: "9",   # Tasks
-        4: "9",   # Subtasks
-        5: "8",
-        6: "8",
-        7: "8"
-    }
+    colors: Optional dictionary mapping levels to colors, or a palette from _palette_for
+    
+    The style depends only on the level and the palette, so results are cached
+    per (level, palette); the returned dict is shared and must not be modified.
+    """
+    palette = colors if isinstance(colors, tuple) else _palette_for(colors)
+    return _node_style_cached(level, palette)
 
+@functools.lru_cache(maxsize=64)
+def _node_style_cached(level: int, palette: Tuple[str, ...]) -> dict:
+    """Build the node style for one level and palette; see _node_style_for."""
+    width, height, fontsize = _LEVEL_DIMENSIONS.get(level, _DEEP_LEVEL_DIMENSIONS)
+    
     return {
         "shape": "box",
         "style": "filled",
         "color": "#3c3836",  # Gruvbox dark0
-        "fillcolor": colors.get(level % len(colors), "#fbf1c7"),
+        "fillcolor": palette[level % len(palette)],
         "fontcolor": "#282828",  # Gruvbox dark
         "fontname": "Arial",
-        "fontsize": font_sizes.get(level, "8"),
+        "fontsize": fontsize,
         "height": height,
         "width": width,
         "margin": "0.1",
         "penwidth": "1.0"
     }
 
+def _flatten_wbs(wbs_structure: dict) -> Tuple[List[str], List[int], List[int], List[str]]:
+    """
+    Flatten a WBS structure into parallel preorder lists (structure of arrays).
+    
+    The tree is walked once with an explicit stack, so later passes over the
+    WBS are linear sweeps instead of recursive traversals.
+    
+    Args:
+        wbs_structure: Dictionary mapping project names to (name, children) tuples
+        
+    Returns:
+        Tuple of (labels, parent_idx, levels, numbers) lists where parent_idx is
+        -1 for project roots and numbers holds the WBS number ("" for roots)
+    """
+    labels: List[str] = []
+    parent_idx: List[int] = []
+    levels: List[int] = []
+    numbers: List[str] = []
+
+    # Each entry is (label, children, parent index, level, WBS number);
+    # children are pushed in reverse so they pop in their original order
+    stack = [(label, children, -1, 0, "") for label, children in reversed(list(wbs_structure.items()))]
+    while stack:
+        label, children, parent, level, number = stack.pop()
+        index = len(labels)
+        # Many labels repeat across branches ("Testing", "Documentation", ...);
+        # interning shares one object per distinct label. YAML keys such as
+        # 2024 or 1.0 load as numbers, so labels are interned as their text.
+        labels.append(sys.intern(str(label)))
+        parent_idx.append(parent)
+        levels.append(level)
+        numbers.append(number)
+
+        child_level = level + 1
+        for idx in range(len(children), 0, -1):
+            child_label, grandchildren = children[idx - 1]
+            # Generate node number based on level and position
+            if child_level == 1:
+                child_number = f"{idx}.0"
+            elif number.endswith('.0'):
+                # Remove the .0 for cleaner numbering
+                child_number = f"{number[:-2]}.{idx}"
+            else:
+                child_number = f"{number}.{idx}"
+            stack.append((child_label, grandchildren or [], index, child_level, child_number))
+
+    return labels, parent_idx, levels, numbers
+
+# Bump whenever the layout or numbering of _flatten_wbs changes, so caches
+# written by older versions are rebuilt instead of loaded
+_WBS_CACHE_VERSION = 1
+
+def _yaml_digest(yaml_file: str) -> str:
+    """Return the BLAKE2b hex digest of a YAML file's contents."""
+    with open(yaml_file, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+def _load_or_build_wbs(
+    yaml_file: str,
+    cache_path: str = None
+) -> Tuple[List[str], List[int], List[int], List[str]]:
+    """
+    Load the flattened WBS for a YAML file, rebuilding it only when the YAML changed.
+    
+    The flattened arrays are stored as JSON next to the YAML file, together
+    with the digest of the YAML contents and _WBS_CACHE_VERSION, and reused
+    only while both match; timestamps play no part. A cache that cannot be
+    read or parsed, or has an unexpected shape, is rebuilt. Writing the cache
+    is best-effort.
+    
+    Args:
+        yaml_file: Path to the YAML file containing WBS structure
+        cache_path: Path of the cache file (defaults to '<yaml_file>.wbs.json')
+        
+    Returns:
+        Tuple of (labels, parent_idx, levels, numbers) lists from _flatten_wbs
+    """
+    if cache_path is None:
+        cache_path = yaml_file + ".wbs.json"
+    digest = _yaml_digest(yaml_file)
+
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = json.load(f)
+        if cached['version'] == _WBS_CACHE_VERSION and cached['digest'] == digest:
+            labels, parent_idx, levels, numbers = cached['wbs']
+            if len(labels) == len(parent_idx) == len(levels) == len(numbers):
+                logger.debug(f"Loaded flattened WBS from cache {cache_path}")
+                return [sys.intern(label) for label in labels], parent_idx, levels, numbers
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable WBS cache {cache_path}: {e}")
+
+    yaml_data = _load_and_extract_cached(yaml_file, digest)[0]
+    flat_wbs = _flatten_wbs(convert_yaml_to_wbs_format(yaml_data))
+
+    # Write to a temporary file and rename it so concurrent readers never see
+    # a partially written cache
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(cache_path)),
+                                        suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'version': _WBS_CACHE_VERSION, 'digest': digest, 'wbs': flat_wbs}, f)
+        os.replace(tmp_path, cache_path)
+        logger.debug(f"Wrote flattened WBS cache {cache_path}")
+    except OSError as e:
+        logger.debug(f"Could not write WBS cache {cache_path}: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return flat_wbs
+
 def create_wbs_diagram(
     wbs_structure: dict,
     output_filename: str = "wbs_output",
@@ -239,10 +408,99 @@ def create_wbs_diagram(
         graph_direction: Direction of the graph ("TB" for top-bottom, "LR" for left-right)
         colors: Optional color scheme for different levels
     """
+    _create_wbs_diagram_flat(_flatten_wbs(wbs_structure), output_filename,
+                             file_format, graph_direction, colors)
+
+def _iter_dot_chunks(lines: Iterable[bytes], chunk_size: int = 4096) -> Iterator[bytes]:
+    """Group encoded DOT source lines into blocks of roughly chunk_size bytes."""
+    block = []
+    size = 0
+    for line in lines:
+        block.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield b"".join(block)
+            block = []
+            size = 0
+    if block:
+        yield b"".join(block)
+
+def _render_dot(chunks: Iterable[bytes], output_path: str, file_format: str) -> None:
+    """
+    Stream DOT source into Graphviz dot, writing output_path.
+    
+    Chunks are written to dot's stdin as they are produced, so the full
+    source never has to be held in memory and dot can start parsing early.
+    """
+    cmd = ["dot", f"-T{file_format}", f"-o{output_path}"]
+    with subprocess.Popen(cmd, stdin=subprocess.PIPE, bufsize=0) as proc:
+        try:
+            for chunk in chunks:
+                proc.stdin.write(chunk)
+        except BrokenPipeError:
+            pass  # dot exited early; its return code says why
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+def _iter_wbs_statements(
+    flat_wbs: Tuple[List[str], List[int], List[int], List[str]],
+    palette: Tuple[str, ...]
+) -> Iterator[bytes]:
+    """
+    Yield the UTF-8 DOT node and edge statements for a flattened WBS.
+    
+    One preorder sweep builds each node's ID, label and style and emits the
+    node followed by the edge from its parent, which is always declared
+    earlier. Node styles depend only on the level, so each level's attribute
+    list is quoted and encoded once, leaving one bytes %-format per statement.
+    """
+    from graphviz.quoting import a_list, quote
+
+    labels, parent_idx, levels, numbers = flat_wbs
+    level_attrs = {}
+    for level in set(levels):
+        level_attrs[level] = a_list(kwargs=_node_style_for(level, palette)).encode("utf-8")
+    edge_attrs = a_list(kwargs=_WBS_EDGE_STYLE).encode("utf-8")
+
+    quoted_ids = []
+    for i, label in enumerate(labels):
+        # Project roots carry no WBS number
+        if levels[i] == 0:
+            node_id = quote(_safe_node_id(label)).encode("utf-8")
+            display_label = label
+        else:
+            node_id = quote(_safe_node_id(f"{label}_{numbers[i]}")).encode("utf-8")
+            display_label = f"{label} ({numbers[i]})"
+        quoted_ids.append(node_id)
+
+        yield b"\t%s [label=%s %s]\n" % (node_id, quote(display_label).encode("utf-8"), level_attrs[levels[i]])
+        if parent_idx[i] >= 0:
+            yield b"\t%s -> %s [%s]\n" % (quoted_ids[parent_idx[i]], node_id, edge_attrs)
+
+def _create_wbs_diagram_flat(
+    flat_wbs: Tuple[List[str], List[int], List[int], List[str]],
+    output_filename: str = "wbs_output",
+    file_format: str = "pdf",
+    graph_direction: str = "LR",
+    colors: dict = None
+) -> None:
+    """
+    Create and save a WBS diagram from a structure flattened by _flatten_wbs.
+    
+    Args:
+        flat_wbs: Tuple of (labels, parent_idx, levels, numbers) lists
+        output_filename: Name of the output file (without extension)
+        file_format: Output format (pdf, png, etc.)
+        graph_direction: Direction of the graph ("TB" for top-bottom, "LR" for left-right)
+        colors: Optional color scheme for different levels
+    """
+    # graphviz is only needed once DOT source is built, so it is imported here
+    # rather than when the module loads
+    from graphviz.quoting import a_list
+
     logger.info("Creating WBS diagram...")
     try:
-        dot = Digraph(comment="Work Breakdown Structure", engine='dot', format=file_format)
-        dot.attr(
+        graph_attrs = [dict(
             rankdir=graph_direction,
             splines="line",
             nodesep="0.2",      # Reduced horizontal spacing
@@ -254,81 +512,28 @@ def create_wbs_diagram(
             bgcolor="#f9f5d7",   # Gruvbox light background
             dpi="600",           # High resolution
             fontname="Arial"     # Consistent font
-        )
+        )]
 
         # Additional PNG-specific attributes for higher quality
         if file_format == "png":
-            dot.attr(
+            graph_attrs.append(dict(
                 dpi="1200",     # Even higher resolution for PNG
                 size="100,50",  # Wide canvas for left-to-right layout
                 ratio="compress" # Maintain aspect ratio while fitting to size
-            )
-
-        def add_nodes_and_edges(items, parent_node=None, level=0, parent_number=""):
-            """
-            Recursively add nodes and edges to the graph.
-            """
-            nodes = []
-            
-            if isinstance(items, dict):
-                # Handle the root level
-                for label, children in items.items():
-                    node_id = _safe_node_id(label)
-                    node_style = _node_style_for(label, level, colors)
-                    dot.node(node_id, label, **node_style)
-                    add_nodes_and_edges(children, node_id, level + 1)
-            else:
-                # Handle list of tuples for other levels
-                for idx, (label, children) in enumerate(items, 1):
-                    # Generate node number based on level and position
-                    if level == 1:
-                        node_number = f"{idx}.0"
-                    elif level > 1:
-                        if parent_number:
-                            if parent_number.endswith('.0'):
-                                # Remove the .0 for cleaner numbering
-                                parent_base = parent_number[:-2]
-                                node_number = f"{parent_base}.{idx}"
-                            else:
-                                node_number = f"{parent_number}.{idx}"
-                        else:
-                            node_number = str(idx)
-                    else:
-                        node_number = ""
-
-                    # Format the display label with the WBS number
-                    if level > 0:  # Don't add number to root level
-                        display_label = f"{label} ({node_number})"
-                    else:
-                        display_label = label
-                    
-                    # Create unique node ID
-                    node_id = _safe_node_id(f"{label}_{node_number}")
-                    
-                    # Add the node
-                    node_style = _node_style_for(display_label, level, colors)
-                    dot.node(node_id, display_label, **node_style)
-                    nodes.append(node_id)
-                    
-                    if parent_node:
-                        dot.edge(parent_node, node_id,
-                               color="#3c3836",  # Gruvbox dark0
-                               arrowsize="0.6",
-                               penwidth="1.0")
-                    
-                    if children:
-                        add_nodes_and_edges(children, node_id, level + 1, node_number)
-            
-            return nodes
+            ))
 
-        # Start with top-level items
-        for top_label, top_structure in wbs_structure.items():
-            top_node_id = _safe_node_id(top_label)
-            dot.node(top_node_id, top_label, **_node_style_for(top_label, 0, colors))
-            add_nodes_and_edges(top_structure, top_node_id, 1)
+        palette = _palette_for(colors)
+        dot_lines = itertools.chain(
+            (b"// Work Breakdown Structure\n", b"digraph {\n"),
+            (b"\t%s\n" % a_list(kwargs=attrs).encode("utf-8") for attrs in graph_attrs),
+            _iter_wbs_statements(flat_wbs, palette),
+            (b"}\n",)
+        )
 
-        # Render the final diagram
-        output_path = dot.render(filename=output_filename, cleanup=True)
+        # Stream the source into dot; nothing touches disk, so several
+        # formats can be rendered concurrently
+        output_path = f"{output_filename}.{file_format}"
+        _render_dot(_iter_dot_chunks(dot_lines), output_path, file_format)
         logger.info(f"WBS diagram saved to: {output_path}")
 
     except Exception as e:
@@ -346,8 +551,65 @@ class RAMColors:
     }
     HEADER = "#3c3836"   # Dark header
     ALTERNATE_ROW = "#f2e5bc"  # Slightly darker than background for alternating rows
+    TYPE_BACKGROUND = {
+        'Project': '#f9f5d7',  # Light beige
+        'Phase': '#ebdbb2',    # Darker beige
+        'Activity': '#d5c4a1',  # Light brown
+        'Task': '#bdae93'      # Medium brown
+    }
 
-def create_ram_legend(dot: Digraph) -> None:
+# Responsibility cell colors, without the 'null' (no involvement) entry
+_RESPONSIBILITY_FILL = {
+    code: color for code, color in RAMColors.RESPONSIBILITY.items() if code != 'null'
+}
+
+# Role columns of the RAM, in display order
+_RAM_ROLES = ('project_manager', 'hardware', 'software', 'testing', 'sponsor', 'other')
+
+# (value field, color field) of each role in _RAM_ROW_TEMPLATE
+_RAM_ROLE_FIELDS = tuple((role, role + '_color') for role in _RAM_ROLES)
+
+# One RAM diagram row: name, type and WBS number, a cell per role, then
+# duration and labor. Role cells use '<role>' and '<role>_color' fields.
+_RAM_ROW_TEMPLATE = (
+    '<TR>'
+    '<TD BGCOLOR="{bg}" ALIGN="left">{name}</TD>'
+    '<TD BGCOLOR="{bg}" ALIGN="left">{type}</TD>'
+    '<TD BGCOLOR="{bg}" ALIGN="left">{wbs_number}</TD>'
+    + ''.join(f'<TD BGCOLOR="{{{role}_color}}" ALIGN="center">{{{role}}}</TD>' for role in _RAM_ROLES)
+    + '<TD BGCOLOR="{bg}" ALIGN="right">{duration}</TD>'
+    '<TD BGCOLOR="{bg}" ALIGN="right">{labor}</TD>'
+    '</TR>'
+)
+
+# Excel RAM sheet: labels of the totals block, in _project_totals order,
+# and the color key written next to it
+_RAM_TOTALS_LABELS = (
+    'Total Items:', 'Total Phases:', 'Total Activities:', 'Total Tasks:',
+    'Total Work Packages:', 'Total Duration (Days):', 'Total Labor (Hours):'
+)
+_RAM_LEGEND = (
+    ('L = Lead', _RESPONSIBILITY_FILL['L']),
+    ('P = Participant', _RESPONSIBILITY_FILL['P']),
+    ('R = Reviewer', _RESPONSIBILITY_FILL['R']),
+    ('I = Input', _RESPONSIBILITY_FILL['I']),
+    ('Project', RAMColors.TYPE_BACKGROUND['Project']),
+    ('Phase', RAMColors.TYPE_BACKGROUND['Phase']),
+    ('Activity', RAMColors.TYPE_BACKGROUND['Activity']),
+    ('Task', RAMColors.TYPE_BACKGROUND['Task']),
+    ('Subtask*', '#ffffff')
+)
+_RAM_LEGEND_NOTE = '* Subtask rows are colored to match their corresponding level in the WBS diagram'
+_RAM_LEGEND_COL = 3  # The legend starts at column D
+_RAM_HEADER_FILL = '#d3d3d3'
+
+# Every fill color used in the Excel RAM sheet
+_RAM_FILL_COLORS = frozenset((
+    *WBSColors.PALETTE, *RAMColors.TYPE_BACKGROUND.values(), *_RESPONSIBILITY_FILL.values(),
+    '#ffffff', _RAM_HEADER_FILL
+))
+
+def create_ram_legend(dot: 'Digraph') -> None:
     """Add a legend explaining responsibility types and colors."""
     with dot.subgraph(name='cluster_legend') as legend:
         legend.attr(label='Legend', style='rounded', bgcolor='white', fontsize="12")
@@ -370,10 +632,69 @@ def create_ram_legend(dot: Digraph) -> None:
             if idx > 0:
                 legend.edge(f'legend_{idx-1}', f'legend_{idx}', style='invis')
 
+# Keys of a WBS YAML node that hold item attributes rather than child items
+_ITEM_METADATA_FIELDS = frozenset({'type', 'responsibilities', 'duration', 'labor', 'name'})
+
+def _item_children(node: Dict) -> List[Tuple[str, Dict]]:
+    """Return the (name, content) child items of a YAML node, skipping metadata fields."""
+    return [(k, v) for k, v in node.items() if k not in _ITEM_METADATA_FIELDS and isinstance(v, dict)]
+
+def _is_subtask(node: Dict) -> bool:
+    """
+    Check if a node is a leaf node (Subtask)
+    
+    Unlike is_leaf_node this only requires 'responsibilities', matching how
+    the RAM and Excel exports have always classified items.
+    """
+    return 'responsibilities' in node
+
+def _generate_wbs_number(path: Tuple[int, ...], level: int) -> str:
+    """Generate WBS number from path and level"""
+    if level == 0:  # Project level
+        return ""
+    elif level == 1:  # Phase level
+        return f"{path[-1]}.0"
+    elif level == 2:  # Activity level
+        return f"{path[1]}.{path[-1]}"  # e.g., 1.1, 1.2, etc.
+    else:
+        # For deeper levels, remove the first number and join the rest
+        return ".".join(str(x) for x in path[1:]) if len(path) > 1 else str(path[0])
+
+def _push_item_children(stack, children, parent_name, level, parent_path) -> None:
+    """
+    Push one node's filtered children onto the extract_items stack.
+    
+    Children are ordered by structure (Phases, then Activities and Tasks, then
+    Subtasks) and pushed in reverse so they pop in that order.
+    """
+    valid_items = []
+    for k, v in children:
+        if level == 1:  # Phase level is determined by hierarchy
+            # Phases come first
+            valid_items.append((0, k, v))
+        elif level == 2:  # Activity level is one level below Phase
+            # Activities come second
+            valid_items.append((1, k, v))
+        elif _is_subtask(v):
+            # Leaf nodes (Subtasks) come last
+            valid_items.append((2, k, v))
+        else:
+            # Other nodes
+            valid_items.append((1, k, v))
+
+    # Sort by the order key; the sort is stable, so ties keep YAML order
+    valid_items.sort(key=lambda x: x[0])
+    for i in range(len(valid_items), 0, -1):
+        _, name, content = valid_items[i - 1]
+        stack.append((i, name, content, parent_name, level, parent_path))
+
 def extract_items(data, parent_name=None, level=0, parent_wbs="", path_index=None):
     """
     Extract hierarchical items from YAML data, skipping nodes with only one child.
     
+    The tree is walked in preorder with an explicit stack, so deep YAML
+    structures cannot hit the recursion limit.
+    
     Args:
         data: Dictionary containing the YAML data
         parent_name: Name of the parent item
@@ -384,139 +705,127 @@ def extract_items(data, parent_name=None, level=0, parent_wbs="", path_index=Non
     Returns:
         List of items with their hierarchy information
     """
-    items = []
-    if path_index is None:
-        path_index = []
-
-    # Filter out metadata fields at the current level
-    metadata_fields = {'type', 'responsibilities', 'duration', 'labor', 'name'}
-    
-    def is_leaf_node(node):
-        """Check if a node is a leaf node (Subtask)"""
-        return isinstance(node, dict) and 'responsibilities' in node
-
-    def has_non_metadata_children(node):
-        """Check if node has any non-metadata children"""
-        if not isinstance(node, dict):
-            return False
-        return any(k not in metadata_fields and isinstance(v, dict) for k, v in node.items())
-
-    def generate_wbs_number(path, level):
-        """Generate WBS number from path and level"""
-        if level == 0:  # Project level
-            return ""
-        elif level == 1:  # Phase level
-            return f"{path[-1]}.0"
-        elif level == 2:  # Activity level
-            return f"{path[1]}.{path[-1]}"  # e.g., 1.1, 1.2, etc.
+    # The path of indices is carried as a tuple; a parent WBS number given by
+    # the caller is parsed once here rather than re-split for every item
+    if parent_wbs:
+        if parent_wbs.endswith('.0'):  # Phase level
+            parent_path = (int(parent_wbs[:-2]),)  # Remove .0 and convert to int
         else:
-            # For deeper levels, remove the first number and join the rest
-            return ".".join(str(x) for x in path[1:]) if len(path) > 1 else str(path[0])
+            # Split the parent WBS number and convert all parts to integers
+            parent_path = tuple(int(x) for x in parent_wbs.split('.'))
+    else:
+        parent_path = tuple(path_index or ())
 
-    def count_valid_children(node):
-        """Count the number of valid (non-metadata) children a node has"""
-        if not isinstance(node, dict):
-            return 0
-        return sum(1 for k, v in node.items() if k not in metadata_fields and isinstance(v, dict))
+    items = []
+    stack = []
+    _push_item_children(stack, _item_children(data), parent_name, level, parent_path)
 
-    # Get all valid items (non-metadata) at this level and sort them by structure
-    valid_items = []
-    for k, v in data.items():
-        if k not in metadata_fields and isinstance(v, dict):
-            if level == 1:  # Phase level is determined by hierarchy
-                # Phases come first
-                valid_items.append((0, k, v))
-            elif level == 2:  # Activity level is one level below Phase
-                # Activities come second
-                valid_items.append((1, k, v))
-            elif is_leaf_node(v):
-                # Leaf nodes (Subtasks) come last
-                valid_items.append((2, k, v))
-            else:
-                # Other nodes
-                valid_items.append((1, k, v))
+    while stack:
+        i, name, content, parent_name, level, parent_path = stack.pop()
 
-    # Sort by the order key and remove it
-    valid_items.sort(key=lambda x: x[0])
-    valid_items = [(k, v) for _, k, v in valid_items]
-
-    for i, (name, content) in enumerate(valid_items, 1):
-        if isinstance(content, dict):
-            # Update the path index for this item
-            if parent_wbs:
-                # If we have a parent WBS number, parse it and add our index
-                if parent_wbs.endswith('.0'):  # Phase level
-                    current_path = [int(parent_wbs[:-2])]  # Remove .0 and convert to int
-                else:
-                    # Split the parent WBS number and convert all parts to integers
-                    current_path = [int(x) for x in parent_wbs.split('.')]
-                current_path.append(i)
+        # Update the path index for this item
+        current_path = parent_path + (i,)
+        
+        # Generate WBS number for display
+        wbs_number = _generate_wbs_number(current_path, level)
+        
+        # Filter the valid children once; the count decides whether to skip
+        children_data = _item_children(content)
+        
+        # Determine if we should skip this node
+        should_skip = len(children_data) == 1 and not _is_subtask(content)
+        
+        if not should_skip:
+            # Determine type based on level and content
+            if level == 0:
+                current_type = "Project"
+                display_name = content.get('name', name)
+            elif level == 1:  # Phase is determined by level
+                current_type = "Phase"
+                display_name = name
+            elif level == 2:  # Activity is one level below Phase
+                current_type = "Activity"
+                display_name = name
+            elif _is_subtask(content):
+                current_type = "Subtask"
+                display_name = name
             else:
-                current_path = path_index + [i]
-            
-            # Generate WBS number for display
-            wbs_number = generate_wbs_number(current_path, level)
+                current_type = "Task"  # Everything else is a Task
+                display_name = name
             
-            # For passing to children, use the full path string
-            child_wbs = ".".join(str(x) for x in current_path)
-            
-            # Count valid children
-            child_count = count_valid_children(content)
-            
-            # Determine if we should skip this node
-            should_skip = child_count == 1 and not is_leaf_node(content)
-            
-            if not should_skip:
-                # Determine type based on level and content
-                if level == 0:
-                    current_type = "Project"
-                    display_name = content.get('name', name)
-                elif level == 1:  # Phase is determined by level
-                    current_type = "Phase"
-                    display_name = name
-                elif level == 2:  # Activity is one level below Phase
-                    current_type = "Activity"
-                    display_name = name
-                elif is_leaf_node(content):
-                    current_type = "Subtask"
-                    display_name = name
-                else:
-                    current_type = "Task"  # Everything else is a Task
-                    display_name = name
-                
-                # Get responsibilities and other attributes
-                responsibilities = content.get('responsibilities', {})
-                duration = content.get('duration', '')
-                labor = content.get('labor', '')
-                
-                # Add the current item
-                items.append({
-                    'name': display_name,
-                    'parent': parent_name,
-                    'type': current_type,
-                    'wbs_number': wbs_number,
-                    'responsibilities': responsibilities,
-                    'duration': duration,
-                    'labor': labor,
-                    'level': level
-                })
+            # Get responsibilities and other attributes
+            responsibilities = content.get('responsibilities', {})
+            duration = content.get('duration', '')
+            labor = content.get('labor', '')
             
-            # Process children (excluding metadata fields)
-            children_data = {k: v for k, v in content.items() if k not in metadata_fields and isinstance(v, dict)}
-            if children_data:
-                # If we're skipping this node, use the parent's name and level
-                next_parent = parent_name if should_skip else display_name
-                next_level = level if should_skip else level + 1
-                items.extend(extract_items(
-                    children_data,
-                    next_parent,
-                    next_level,
-                    child_wbs,
-                    current_path
-                ))
+            # Add the current item
+            items.append({
+                'name': display_name,
+                'parent': parent_name,
+                'type': current_type,
+                'wbs_number': wbs_number,
+                'responsibilities': responsibilities,
+                'duration': duration,
+                'labor': labor,
+                'level': level
+            })
+        
+        # Queue children (excluding metadata fields); they are emitted right
+        # after this item and before its next sibling
+        if children_data:
+            # If we're skipping this node, use the parent's name and level
+            next_parent = parent_name if should_skip else display_name
+            next_level = level if should_skip else level + 1
+            _push_item_children(stack, children_data, next_parent, next_level, current_path)
     
     return items
 
+def _project_totals(all_items: List[Dict]) -> Tuple[int, int, int, int, int, int, int]:
+    """
+    Count items by type and sum duration and labor in a single pass.
+    
+    Returns:
+        Tuple of (items, phases, activities, tasks, subtasks, duration, labor)
+    """
+    type_counts = {'Phase': 0, 'Activity': 0, 'Task': 0, 'Subtask': 0}
+    total_duration = 0
+    total_labor = 0
+    for item in all_items:
+        item_type = item['type']
+        if item_type in type_counts:
+            type_counts[item_type] += 1
+        duration = item['duration']
+        if duration:
+            total_duration += int(duration)
+        labor = item['labor']
+        if labor:
+            total_labor += int(labor)
+    return (len(all_items), type_counts['Phase'], type_counts['Activity'], type_counts['Task'],
+            type_counts['Subtask'], total_duration, total_labor)
+
+@functools.lru_cache(maxsize=8)
+def _load_and_extract_cached(yaml_file: str, digest: str) -> Tuple[Dict, List[Dict], Tuple[int, ...]]:
+    yaml_data = load_wbs_from_yaml(yaml_file)
+    all_items = extract_items(yaml_data)
+    return yaml_data, all_items, _project_totals(all_items)
+
+def _load_and_extract(yaml_file: str) -> Tuple[Dict, List[Dict], Tuple[int, ...]]:
+    """
+    Load a WBS YAML file and extract its items, once per file version.
+    
+    Results are memoized on (path, content digest) so the WBS, RAM and Excel builds
+    for the same file share a single parse, traversal and totals pass. The returned
+    objects are shared between callers and must not be modified.
+    
+    Args:
+        yaml_file: Path to the YAML file containing WBS structure
+        
+    Returns:
+        Tuple of (yaml_data, all_items, totals) as returned by
+        load_wbs_from_yaml, extract_items and _project_totals
+    """
+    return _load_and_extract_cached(yaml_file, _yaml_digest(yaml_file))
+
 def create_ram_diagram(
     yaml_file: str,
     output_filename: str = "ram_output",
@@ -525,10 +834,12 @@ def create_ram_diagram(
     """
     Create and save a Responsibility Assignment Matrix diagram as a simple CSV-like table.
     """
+    from graphviz.quoting import a_list
+
     logger.info("Creating RAM diagram...")
     try:
         # Load and process YAML data
-        yaml_data = load_wbs_from_yaml(yaml_file)
+        yaml_data, all_items, totals = _load_and_extract(yaml_file)
         
         # Get project name from YAML
         project_name = ""
@@ -537,9 +848,8 @@ def create_ram_diagram(
                 project_name = root_items.get('name', root_name)
                 break
         
-        # Create the diagram
-        dot = Digraph(comment="RAM", engine='dot', format=file_format)
-        dot.attr(
+        # Graph attributes of the diagram
+        graph_attrs = [dict(
             rankdir="TB",
             splines="none",
             nodesep="0.2",
@@ -547,15 +857,15 @@ def create_ram_diagram(
             pad="0.2",
             bgcolor="white",
             dpi="600"  # High resolution
-        )
+        )]
 
         # Additional PNG-specific attributes for higher quality
         if file_format == "png":
-            dot.attr(
+            graph_attrs.append(dict(
                 dpi="1200",     # Even higher resolution for PNG
                 size="50,50",   # Large canvas size
                 ratio="compress" # Maintain aspect ratio while fitting to size
-            )
+            ))
 
         # Create the main RAM table with project name in header
         main_table_html = f'''<
@@ -578,84 +888,54 @@ def create_ram_diagram(
             </TR>
         '''
 
-        # Extract all items
-        all_items = extract_items(yaml_data)
-
-        # Track the level for WBS colors
-        current_level = 0
-        prev_parent = None
-
-        # Add data rows to main table
+        # Collect the header and every row, then join once at the end
+        # Rows are encoded as they are built, so the table is never held as
+        # one large str that has to be quoted and encoded again at the end
+        table_parts = [main_table_html.encode("utf-8")]
+        
+        # Build each level's name indent once instead of once per row
+        max_level = max((item['level'] for item in all_items), default=0)
+        indents = ["&nbsp;" * (4 * level) for level in range(max_level + 1)]
         for item in all_items:
-            # Indent name based on level and type
-            indent = "&nbsp;" * (4 * item['level'])
-            name_cell = f"{indent}{item['name']}"
-            
-            # Reset level counter when parent changes
-            if item['parent'] != prev_parent:
-                if item['level'] <= current_level:
-                    current_level = item['level']
-                prev_parent = item['parent']
-            
             # Set background color based on type and level
-            if item['type'] == 'Subtask':
+            item_type = item['type']
+            if item_type == 'Subtask':
                 bg_color = WBSColors.DEFAULT.get(item['level'], WBSColors.DEFAULT[0])
             else:
-                bg_color = {
-                    'Project': '#f9f5d7',  # Light beige
-                    'Phase': '#ebdbb2',    # Darker beige
-                    'Activity': '#d5c4a1',  # Light brown
-                    'Task': '#bdae93'      # Medium brown
-                }.get(item['type'], 'white')
-            
-            row = '<TR>'
-            
-            # Apply background color to all cells
-            row += f'<TD BGCOLOR="{bg_color}" ALIGN="left">{name_cell}</TD>'
-            row += f'<TD BGCOLOR="{bg_color}" ALIGN="left">{item["type"]}</TD>'
+                bg_color = RAMColors.TYPE_BACKGROUND.get(item_type, 'white')
             
-            # Work package cell (WBS number)
-            row += f'<TD BGCOLOR="{bg_color}" ALIGN="left">{item["wbs_number"]}</TD>'
+            fields = {
+                'bg': bg_color,
+                # Indent name based on level
+                'name': indents[item['level']] + str(item['name']),
+                'type': item_type,
+                'wbs_number': item['wbs_number'],
+                'duration': item['duration'],
+                'labor': item['labor']
+            }
             
-            # Role cells
-            roles = ['project_manager', 'hardware', 'software', 'testing', 'sponsor', 'other']
-            for role in roles:
-                resp = item['responsibilities'].get(role, '')
-                if item['type'] == 'Subtask' and resp:
-                    resp_color = {
-                        'L': '#af3a03',  # Lead - Darker orange
-                        'P': '#427b58',  # Participant - Even darker green
-                        'R': '#8f3f71',  # Reviewer - Even darker purple
-                        'I': '#076678'   # Input - Even darker blue
-                    }.get(resp, bg_color)
+            # Role cells; only Subtasks color their responsibility codes
+            responsibilities = item['responsibilities']
+            is_subtask = item_type == 'Subtask'
+            for role, color_field in _RAM_ROLE_FIELDS:
+                resp = responsibilities.get(role, '')
+                fields[role] = resp
+                if is_subtask and resp:
+                    fields[color_field] = _RESPONSIBILITY_FILL.get(resp, bg_color)
                 else:
-                    resp_color = bg_color
-                row += f'<TD BGCOLOR="{resp_color}" ALIGN="center">{resp}</TD>'
+                    fields[color_field] = bg_color
             
-            # Duration and labor cells
-            row += f'<TD BGCOLOR="{bg_color}" ALIGN="right">{item["duration"]}</TD>'
-            row += f'<TD BGCOLOR="{bg_color}" ALIGN="right">{item["labor"]}</TD>'
-            row += '</TR>'
-            
-            main_table_html += row
+            table_parts.append(_RAM_ROW_TEMPLATE.format_map(fields).encode("utf-8"))
 
         # Close the main table
-        main_table_html += '</TABLE>>'
-        
-        # Create the main RAM table node
-        dot.node('ram_table', main_table_html, shape='none')
-
-        # Calculate totals
-        total_items = len(all_items)
-        total_phases = sum(1 for item in all_items if item['type'] == 'Phase')
-        total_activities = sum(1 for item in all_items if item['type'] == 'Activity')
-        total_tasks = sum(1 for item in all_items if item['type'] == 'Task')
-        total_subtasks = sum(1 for item in all_items if item['type'] == 'Subtask')
-        total_duration = sum(int(item['duration']) for item in all_items if item['duration'])
-        total_labor = sum(int(item['labor']) for item in all_items if item['labor'])
+        table_parts.append(b'</TABLE>>')
+
+        # Totals are computed once per file version by _load_and_extract
+        (total_items, total_phases, total_activities, total_tasks,
+         total_subtasks, total_duration, total_labor) = totals
 
         # Create a table to hold both totals and legend side by side
-        bottom_table_html = '''<
+        bottom_table_html = f'''<
         <TABLE BORDER="0" CELLBORDER="0" CELLSPACING="20" CELLPADDING="4">
         <TR>
         <TD>
@@ -665,31 +945,31 @@ def create_ram_diagram(
                 </TR>
                 <TR>
                     <TD BGCOLOR="lightgray" ALIGN="right">Total Items:</TD>
-                    <TD BGCOLOR="white" ALIGN="left">&nbsp;''' + str(total_items) + '''</TD>
+                    <TD BGCOLOR="white" ALIGN="left">&nbsp;{total_items}</TD>
                 </TR>
                 <TR>
                     <TD BGCOLOR="lightgray" ALIGN="right">Total Phases:</TD>
-                    <TD BGCOLOR="white" ALIGN="left">&nbsp;''' + str(total_phases) + '''</TD>
+                    <TD BGCOLOR="white" ALIGN="left">&nbsp;{total_phases}</TD>
                 </TR>
                 <TR>
                     <TD BGCOLOR="lightgray" ALIGN="right">Total Activities:</TD>
-                    <TD BGCOLOR="white" ALIGN="left">&nbsp;''' + str(total_activities) + '''</TD>
+                    <TD BGCOLOR="white" ALIGN="left">&nbsp;{total_activities}</TD>
                 </TR>
                 <TR>
                     <TD BGCOLOR="lightgray" ALIGN="right">Total Tasks:</TD>
-                    <TD BGCOLOR="white" ALIGN="left">&nbsp;''' + str(total_tasks) + '''</TD>
+                    <TD BGCOLOR="white" ALIGN="left">&nbsp;{total_tasks}</TD>
                 </TR>
                 <TR>
                     <TD BGCOLOR="lightgray" ALIGN="right">Total Work Packages:</TD>
-                    <TD BGCOLOR="white" ALIGN="left">&nbsp;''' + str(total_subtasks) + '''</TD>
+                    <TD BGCOLOR="white" ALIGN="left">&nbsp;{total_subtasks}</TD>
                 </TR>
                 <TR>
                     <TD BGCOLOR="lightgray" ALIGN="right">Total Duration (Days):</TD>
-                    <TD BGCOLOR="white" ALIGN="left">&nbsp;''' + str(total_duration) + '''</TD>
+                    <TD BGCOLOR="white" ALIGN="left">&nbsp;{total_duration}</TD>
                 </TR>
                 <TR>
                     <TD BGCOLOR="lightgray" ALIGN="right">Total Labor (Hours):</TD>
-                    <TD BGCOLOR="white" ALIGN="left">&nbsp;''' + str(total_labor) + '''</TD>
+                    <TD BGCOLOR="white" ALIGN="left">&nbsp;{total_labor}</TD>
                 </TR>
             </TABLE>
         </TD>
@@ -722,207 +1002,302 @@ def create_ram_diagram(
         </TR>
         </TABLE>
         >'''
-        dot.node('bottom_section', bottom_table_html, shape='none')
 
-        # Create invisible edge to control layout
-        dot.edge('ram_table', 'bottom_section', style='invis')
+        # The two HTML-table nodes, joined by an invisible edge to control layout.
+        # The main table is an HTML-like label, which DOT takes verbatim, so its
+        # encoded rows are streamed as they are instead of going through quote()
+        dot_lines = [
+            b"// RAM\n",
+            b"digraph {\n",
+            *(b"\t%s\n" % a_list(kwargs=attrs).encode("utf-8") for attrs in graph_attrs),
+            b"\tram_table [label=",
+            *table_parts,
+            b" shape=none]\n",
+            b"\tbottom_section [%s]\n" % a_list(bottom_table_html, kwargs={'shape': 'none'}).encode("utf-8"),
+            b"\tram_table -> bottom_section [style=invis]\n",
+            b"}\n"
+        ]
 
-        # Render the diagram
-        output_path = dot.render(filename=output_filename, cleanup=True)
+        # Stream the source into dot; nothing touches disk, so several
+        # formats can be rendered concurrently
+        output_path = f"{output_filename}.{file_format}"
+        _render_dot(_iter_dot_chunks(dot_lines), output_path, file_format)
         logger.info(f"RAM diagram saved to: {output_path}")
 
     except Exception as e:
         logger.error("Error while creating RAM diagram:", exc_info=True)
         raise
 
-def export_to_excel(all_items: List[Dict], output_filename: str = "project_data") -> None:
+def _ram_row_fill(item: Dict) -> str:
+    """Return the background color of an item's Excel RAM row."""
+    if item['type'] == 'Subtask':
+        # Subtasks match their level in the WBS diagram
+        return WBSColors.DEFAULT.get(item['level'], WBSColors.DEFAULT[0])
+    return RAMColors.TYPE_BACKGROUND.get(item['type'], '#ffffff')
+
+def _ram_column_widths(ram_df, totals: Sequence[int]) -> Dict[int, int]:
     """
-    Export WBS and RAM data to Excel files.
+    Return the Excel RAM column widths, fitting the widest value of each column.
+    
+    Widths are measured from the data one column at a time, plus the totals
+    and legend text that share those columns, and are the only sizing either
+    Excel backend does: the row-writing loops never track lengths per cell.
     
     Args:
-        all_items: List of dictionaries containing item data
-        output_filename: Base name for the output files (without extension)
+        ram_df: RAM DataFrame written as the header and data rows
+        totals: Project totals, as returned by _project_totals
     """
-    logger.info("Exporting data to Excel...")
+    # Measure the data rows one whole column at a time
+    max_lengths = {}
+    for col_idx, header in enumerate(ram_df.columns):
+        lengths = ram_df[header].astype(str).str.len()
+        max_lengths[col_idx] = max(len(header), int(lengths.max()) if len(lengths) else 0)
+    def widen(col_idx: int, values: Iterable[Any]) -> None:
+        max_lengths[col_idx] = max(max_lengths.get(col_idx, 0), *(len(str(value)) for value in values))
     
-    # Prepare WBS data
-    wbs_data = []
-    for item in all_items:
-        wbs_data.append({
-            'WBS Number': item['wbs_number'],
-            'Level': item['level'],
-            'Type': item['type'],
-            'Name': item['name'],
-            'Parent': item['parent']
-        })
+    widen(0, ['Project Totals', *_RAM_TOTALS_LABELS])
+    widen(1, totals)
+    widen(_RAM_LEGEND_COL, ['Key', _RAM_LEGEND_NOTE])
+    for col_idx, (text, _) in enumerate(_RAM_LEGEND, start=_RAM_LEGEND_COL):
+        widen(col_idx, [text])
+    return {col_idx: max_length + 2 for col_idx, max_length in max_lengths.items()}
+
+def _wbs_sheet_rows(wbs_df) -> Iterator[List[Any]]:
+    """
+    Yield the WBS sheet rows, header first.
     
-    # Create WBS DataFrame and export
-    wbs_df = pd.DataFrame(wbs_data)
-    wbs_excel_file = f"{output_filename}_wbs.xlsx"
-    wbs_df.to_excel(wbs_excel_file, index=False, sheet_name='WBS')
-    logger.info(f"WBS data exported to: {wbs_excel_file}")
+    Missing parents and blank WBS numbers become None, so they are written
+    as empty cells, as to_excel does.
+    """
+    import pandas as pd
+
+    yield list(wbs_df.columns)
+    for values in wbs_df.itertuples(index=False, name=None):
+        yield [None if pd.isna(value) or value == '' else value for value in values]
+
+def _write_excel_xlsxwriter(
+    excel_file: str, wbs_df, ram_df, all_items: List[Dict], totals: Sequence[int]
+) -> None:
+    """
+    Write the WBS sheet and the formatted RAM sheet into one workbook with xlsxwriter.
     
-    # Prepare RAM data with full hierarchy
-    ram_data = []
-    for item in all_items:
-        # Create indentation based on level
-        indent = "    " * item['level']
-        name = f"{indent}{item['name']}"
+    The workbook is written in constant_memory mode: each row is flushed to
+    disk once the next one starts, so rows are written strictly in order and
+    peak memory stays around one row instead of the whole sheet.
+    """
+    import xlsxwriter
+
+    with xlsxwriter.Workbook(excel_file, {'constant_memory': True}) as workbook:
+        wbs_sheet = workbook.add_worksheet('WBS')
+        for row_idx, values in enumerate(_wbs_sheet_rows(wbs_df)):
+            wbs_sheet.write_row(row_idx, 0, values)
         
-        # Prepare row data
-        row_data = {
-            'WBS Element/Personnel': name,
-            'Work Package Type': item['type'],
-            'Work Package': item['wbs_number'] if item['type'] == 'Subtask' else '',
-            'Project Manager': item['responsibilities'].get('project_manager', ''),
-            'Hardware': item['responsibilities'].get('hardware', ''),
-            'Software': item['responsibilities'].get('software', ''),
-            'Testing': item['responsibilities'].get('testing', ''),
-            'Sponsor': item['responsibilities'].get('sponsor', ''),
-            'Other': item['responsibilities'].get('other', ''),
-            'Work Package Duration (Days)': item['duration'],
-            'Work Package Labor (Person Hours)': item['labor']
-        }
-        ram_data.append(row_data)
-    
-    # Create RAM DataFrame
-    ram_df = pd.DataFrame(ram_data)
-    
-    # Export RAM to Excel with formatting
-    ram_excel_file = f"{output_filename}_ram.xlsx"
-    with pd.ExcelWriter(ram_excel_file, engine='openpyxl') as writer:
-        ram_df.to_excel(writer, index=False, sheet_name='RAM')
+        # RAM cells are written once below, already carrying their formats
+        worksheet = workbook.add_worksheet('RAM')
         
-        # Get the workbook and worksheet
-        workbook = writer.book
-        worksheet = writer.sheets['RAM']
+        # Create every cell format once, before any cell is written, and
+        # share it between all cells of that color
+        fills = {color: workbook.add_format({'bg_color': color, 'pattern': 1}) for color in _RAM_FILL_COLORS}
+        resp_fills = {code: fills[color] for code, color in _RESPONSIBILITY_FILL.items()}
+        bold_header = workbook.add_format({'bg_color': _RAM_HEADER_FILL, 'pattern': 1, 'bold': True})
+        header_format = workbook.add_format({
+            'bg_color': _RAM_HEADER_FILL, 'pattern': 1, 'bold': True,
+            'border': 1, 'align': 'center', 'valign': 'top'
+        })
         
-        # Define styles
-        header_fill = openpyxl.styles.PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
+        # Adjust column widths
+        for col_idx, width in _ram_column_widths(ram_df, totals).items():
+            worksheet.set_column(col_idx, col_idx, width)
         
-        # Style headers
-        for cell in worksheet[1]:
-            cell.fill = header_fill
-            cell.font = openpyxl.styles.Font(bold=True)
+        # Write headers
+        worksheet.write_row(0, 0, list(ram_df.columns), header_format)
         
-        # Style data rows
-        for row_idx, item in enumerate(all_items, start=2):
-            # Set row background based on type and level
-            if item['type'] == 'Subtask':
-                # Remove the '#' from the color code
-                color = WBSColors.DEFAULT.get(item['level'], WBSColors.DEFAULT[0])[1:]
-                fill = openpyxl.styles.PatternFill(start_color=color, end_color=color, fill_type='solid')
-            else:
-                colors = {
-                    'Project': 'F9F5D7',
-                    'Phase': 'EBDBB2',
-                    'Activity': 'D5C4A1',
-                    'Task': 'BDAE93'
-                }
-                color = colors.get(item['type'], 'FFFFFF')
-                fill = openpyxl.styles.PatternFill(start_color=color, end_color=color, fill_type='solid')
+        # Write data rows a whole row, or run of same-format cells, at a time
+        for row_idx, (item, values) in enumerate(
+                zip(all_items, ram_df.itertuples(index=False, name=None)), start=1):
+            row_format = fills[_ram_row_fill(item)]
+            if item['type'] != 'Subtask':
+                worksheet.write_row(row_idx, 0, values, row_format)
+                continue
             
-            # Apply background color to all cells in the row
-            for cell in worksheet[row_idx]:
-                cell.fill = fill
-            
-            # Color responsibility cells for Subtasks
-            if item['type'] == 'Subtask':
-                resp_colors = {
-                    'L': 'AF3A03',
-                    'P': '427B58',
-                    'R': '8F3F71',
-                    'I': '076678'
-                }
-                
-                # Columns D-I are responsibility columns (Project Manager to Other)
-                for col_idx, role in enumerate(['project_manager', 'hardware', 'software', 'testing', 'sponsor', 'other'], start=4):
-                    cell = worksheet.cell(row=row_idx, column=col_idx)
-                    resp = item['responsibilities'].get(role, '')
-                    if resp in resp_colors:
-                        cell.fill = openpyxl.styles.PatternFill(
-                            start_color=resp_colors[resp],
-                            end_color=resp_colors[resp],
-                            fill_type='solid'
-                        )
-        
-        # Add totals section
-        total_rows = len(all_items) + 3  # Leave a blank row
-        total_items = len(all_items)
-        total_phases = sum(1 for item in all_items if item['type'] == 'Phase')
-        total_activities = sum(1 for item in all_items if item['type'] == 'Activity')
-        total_tasks = sum(1 for item in all_items if item['type'] == 'Task')
-        total_subtasks = sum(1 for item in all_items if item['type'] == 'Subtask')
-        total_duration = sum(int(item['duration']) for item in all_items if item['duration'])
-        total_labor = sum(int(item['labor']) for item in all_items if item['labor'])
+            # Subtasks color their responsibility cells (columns D-I) by code
+            worksheet.write_row(row_idx, 0, values[:3], row_format)
+            for col_idx in range(3, 9):
+                value = values[col_idx]
+                worksheet.write(row_idx, col_idx, value, resp_fills.get(value, row_format))
+            worksheet.write_row(row_idx, 9, values[9:], row_format)
         
-        # Write totals header
-        worksheet.cell(row=total_rows, column=1, value='Project Totals').fill = header_fill
-        worksheet.cell(row=total_rows, column=1).font = openpyxl.styles.Font(bold=True)
-        worksheet.merge_cells(start_row=total_rows, start_column=1, end_row=total_rows, end_column=2)
-        
-        # Write totals
-        totals_data = [
-            ('Total Items:', total_items),
-            ('Total Phases:', total_phases),
-            ('Total Activities:', total_activities),
-            ('Total Tasks:', total_tasks),
-            ('Total Work Packages:', total_subtasks),
-            ('Total Duration (Days):', total_duration),
-            ('Total Labor (Hours):', total_labor)
-        ]
-        
-        for idx, (label, value) in enumerate(totals_data):
-            row = total_rows + idx + 1
-            worksheet.cell(row=row, column=1, value=label).fill = header_fill
-            worksheet.cell(row=row, column=2, value=value)
-        
-        # Add legend
-        legend_row = total_rows
-        legend_col = 4  # Start the legend at column D
-        
-        # Legend header
-        worksheet.cell(row=legend_row, column=legend_col, value='Key').fill = header_fill
-        worksheet.cell(row=legend_row, column=legend_col).font = openpyxl.styles.Font(bold=True)
-        worksheet.merge_cells(start_row=legend_row, start_column=legend_col, end_row=legend_row, end_column=legend_col + 7)
-        
-        # Legend entries
-        legend_entries = [
-            ('L = Lead', 'AF3A03'),
-            ('P = Participant', '427B58'),
-            ('R = Reviewer', '8F3F71'),
-            ('I = Input', '076678'),
-            ('Project', 'F9F5D7'),
-            ('Phase', 'EBDBB2'),
-            ('Activity', 'D5C4A1'),
-            ('Task', 'BDAE93'),
-            ('Subtask*', 'FFFFFF')
-        ]
-        
-        # Add legend entries in a single row
-        for col_idx, (text, color) in enumerate(legend_entries):
-            cell = worksheet.cell(row=legend_row + 1, column=legend_col + col_idx, value=text)
-            cell.fill = openpyxl.styles.PatternFill(start_color=color, end_color=color, fill_type='solid')
-        
-        # Add legend note
-        note = '* Subtask rows are colored to match their corresponding level in the WBS diagram'
-        worksheet.cell(row=legend_row + 2, column=legend_col, value=note)
-        worksheet.merge_cells(start_row=legend_row + 2, start_column=legend_col, end_row=legend_row + 2, end_column=legend_col + 7)
-        
-        # Adjust column widths
-        for column in worksheet.columns:
-            max_length = 0
-            column = list(column)
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = (max_length + 2)
-            worksheet.column_dimensions[column[0].column_letter].width = adjusted_width
-    
-    logger.info(f"RAM data exported to: {ram_excel_file}")
+        # Add totals section, leaving a blank row, with the legend beside it.
+        # Rows must be written in order, so each legend row is written along
+        # with the totals row it shares: the headers, then the entries, then
+        # the note.
+        total_rows = len(all_items) + 2
+        legend_col = _RAM_LEGEND_COL
+        worksheet.merge_range(total_rows, 0, total_rows, 1, 'Project Totals', bold_header)
+        worksheet.merge_range(total_rows, legend_col, total_rows, legend_col + 7, 'Key', bold_header)
+        for row, (label, value) in enumerate(zip(_RAM_TOTALS_LABELS, totals), start=total_rows + 1):
+            worksheet.write(row, 0, label, fills[_RAM_HEADER_FILL])
+            worksheet.write(row, 1, value)
+            if row == total_rows + 1:
+                for col_idx, (text, color) in enumerate(_RAM_LEGEND, start=legend_col):
+                    worksheet.write(row, col_idx, text, fills[color])
+            elif row == total_rows + 2:
+                worksheet.merge_range(row, legend_col, row, legend_col + 7, _RAM_LEGEND_NOTE)
+
+def _write_excel_pyexcelerate(
+    excel_file: str, wbs_df, ram_df, all_items: List[Dict], totals: Sequence[int]
+) -> None:
+    """
+    Write the WBS sheet and the formatted RAM sheet into one workbook with pyexcelerate.
+    
+    Produces the same workbook as _write_excel_xlsxwriter, except that empty
+    styled cells hold empty text (pyexcelerate cannot write styled blanks).
+    pyexcelerate rows and columns are 1-based.
+    """
+    from pyexcelerate import Workbook, Style, Fill, Font, Color, Alignment
+    from pyexcelerate.Border import Border
+    from pyexcelerate.Borders import Borders
+
+    def fill_style(color: str, **kwargs) -> Style:
+        rgb = Color(int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16))
+        return Style(fill=Fill(background=rgb), **kwargs)
+
+    workbook = Workbook()
+    
+    # Unstyled WBS sheet
+    workbook.new_sheet('WBS', data=list(_wbs_sheet_rows(wbs_df)))
+    
+    # Hand the RAM header and data rows to pyexcelerate as plain lists in one
+    # go; the loops below only attach styles
+    rows = [list(values) for values in ram_df.itertuples(index=False, name=None)]
+    worksheet = workbook.new_sheet('RAM', data=[list(ram_df.columns), *rows])
+    
+    # Create every style once and share it between all cells of that color
+    fills = {color: fill_style(color) for color in _RAM_FILL_COLORS}
+    resp_fills = {code: fills[color] for code, color in _RESPONSIBILITY_FILL.items()}
+    bold_header = fill_style(_RAM_HEADER_FILL, font=Font(bold=True))
+    header_style = fill_style(
+        _RAM_HEADER_FILL, font=Font(bold=True),
+        borders=Borders(left=Border(), right=Border(), top=Border(), bottom=Border()),
+        alignment=Alignment(horizontal='center', vertical='top')
+    )
+    
+    def write(row: int, col: int, value: Any, style: Style = None) -> None:
+        worksheet.set_cell_value(row, col, value)
+        if style is not None:
+            worksheet.set_cell_style(row, col, style)
+    
+    # Style headers
+    for col in range(1, len(ram_df.columns) + 1):
+        worksheet.set_cell_style(1, col, header_style)
+    
+    # Style data rows
+    for row_idx, (item, values) in enumerate(zip(all_items, rows), start=2):
+        row_style = fills[_ram_row_fill(item)]
+        is_subtask = item['type'] == 'Subtask'
+        for col_idx, value in enumerate(values):
+            style = row_style
+            if is_subtask and 3 <= col_idx <= 8 and value in resp_fills:
+                style = resp_fills[value]
+            worksheet.set_cell_style(row_idx, col_idx + 1, style)
+    
+    # Add totals section, leaving a blank row
+    total_rows = len(all_items) + 3
+    write(total_rows, 1, 'Project Totals', bold_header)
+    worksheet.range((total_rows, 1), (total_rows, 2)).merge()
+    for row, (label, value) in enumerate(zip(_RAM_TOTALS_LABELS, totals), start=total_rows + 1):
+        write(row, 1, label, fills[_RAM_HEADER_FILL])
+        write(row, 2, value)
+    
+    # Add legend: header, entries in a single row, then the note
+    legend_col = _RAM_LEGEND_COL + 1
+    write(total_rows, legend_col, 'Key', bold_header)
+    worksheet.range((total_rows, legend_col), (total_rows, legend_col + 7)).merge()
+    for col_idx, (text, color) in enumerate(_RAM_LEGEND, start=legend_col):
+        write(total_rows + 1, col_idx, text, fills[color])
+    write(total_rows + 2, legend_col, _RAM_LEGEND_NOTE)
+    worksheet.range((total_rows + 2, legend_col), (total_rows + 2, legend_col + 7)).merge()
+    
+    # Adjust column widths
+    for col_idx, width in _ram_column_widths(ram_df, totals).items():
+        worksheet.set_col_style(col_idx + 1, Style(size=width))
+    
+    workbook.save(excel_file)
+
+# Workbook writer for each export_to_excel backend
+_EXCEL_WRITERS = {'xlsxwriter': _write_excel_xlsxwriter, 'pyexcelerate': _write_excel_pyexcelerate}
+
+def export_to_excel(
+    all_items: List[Dict],
+    output_filename: str = "project_data",
+    totals: Tuple[int, ...] = None,
+    backend: str = "xlsxwriter"
+) -> None:
+    """
+    Export WBS and RAM data to one Excel workbook with a WBS and a RAM sheet.
+    
+    Args:
+        all_items: List of dictionaries containing item data
+        output_filename: Name of the output workbook (without extension)
+        totals: Precomputed _project_totals(all_items), computed here if omitted
+        backend: Library that writes the workbook, "xlsxwriter" or
+            "pyexcelerate" (falls back to xlsxwriter if not installed)
+    """
+    # pandas is only needed here, so diagram-only callers do not pay for
+    # importing it
+    import importlib.util
+    import pandas as pd
+
+    if backend not in _EXCEL_WRITERS:
+        raise ValueError(f"Unknown Excel backend: {backend!r}")
+    logger.info("Exporting data to Excel...")
+    
+    # Load the items into a DataFrame once; both sheets are built from its columns
+    items_df = pd.DataFrame(all_items, columns=[
+        'wbs_number', 'level', 'type', 'name', 'parent', 'responsibilities', 'duration', 'labor'
+    ])
+    
+    # Create WBS DataFrame
+    wbs_df = items_df[['wbs_number', 'level', 'type', 'name', 'parent']].rename(columns={
+        'wbs_number': 'WBS Number',
+        'level': 'Level',
+        'type': 'Type',
+        'name': 'Name',
+        'parent': 'Parent'
+    })
+    # Prepare RAM data with full hierarchy, one column at a time. Missing
+    # responsibilities become empty cells.
+    responsibilities = pd.DataFrame(
+        items_df['responsibilities'].tolist(), columns=list(_RAM_ROLES), index=items_df.index
+    ).fillna('')
+    max_level = max((item['level'] for item in all_items), default=0)
+    indents = ["    " * level for level in range(max_level + 1)]
+    ram_df = pd.DataFrame({
+        # Indent names based on level, from one prebuilt indent per level. Names
+        # from numeric YAML keys such as 2024 or 1.0 are joined as their text.
+        'WBS Element/Personnel': items_df['level'].map(indents.__getitem__) + items_df['name'].astype(str),
+        'Work Package Type': items_df['type'],
+        'Work Package': items_df['wbs_number'].where(items_df['type'] == 'Subtask', ''),
+        'Project Manager': responsibilities['project_manager'],
+        'Hardware': responsibilities['hardware'],
+        'Software': responsibilities['software'],
+        'Testing': responsibilities['testing'],
+        'Sponsor': responsibilities['sponsor'],
+        'Other': responsibilities['other'],
+        'Work Package Duration (Days)': items_df['duration'],
+        'Work Package Labor (Person Hours)': items_df['labor']
+    })
+    
+    # Export both sheets, formatting the RAM
+    if totals is None:
+        totals = _project_totals(all_items)
+    if backend == 'pyexcelerate' and importlib.util.find_spec('pyexcelerate') is None:
+        logger.warning("pyexcelerate is not installed, writing the workbook with xlsxwriter")
+        backend = 'xlsxwriter'
+    excel_file = f"{output_filename}.xlsx"
+    _EXCEL_WRITERS[backend](excel_file, wbs_df, ram_df, all_items, totals)
+    
+    logger.info(f"WBS and RAM data exported to: {excel_file}")
 
 def create_wbs_and_ram(
     yaml_file: str,
@@ -939,21 +1314,22 @@ def create_wbs_and_ram(
         wbs_filename: Name of the WBS output file (without extension)
         ram_filename: Name of the RAM output file (without extension)
         file_format: Output format for diagrams (pdf, png, etc.)
-        excel_filename: Base name for Excel output files (without extension)
+        excel_filename: Name of the Excel output workbook (without extension)
     """
-    # Load YAML data once
-    yaml_data = load_wbs_from_yaml(yaml_file)
-    
-    # Create WBS diagram in both PDF and PNG
-    create_wbs_from_yaml(yaml_file, wbs_filename, "pdf")
-    create_wbs_from_yaml(yaml_file, wbs_filename, "png")
+    # Load and extract the YAML once; every build below reuses the result
+    _, all_items, totals = _load_and_extract(yaml_file)
     
-    # Extract items for RAM and Excel export
-    all_items = extract_items(yaml_data)
-    
-    # Create RAM diagram in both PDF and PNG
-    create_ram_diagram(yaml_file, ram_filename, "pdf")
-    create_ram_diagram(yaml_file, ram_filename, "png")
+    # Create WBS and RAM diagrams in both PDF and PNG. Each render is an
+    # independent dot subprocess, so they run concurrently.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(create_wbs_from_yaml, yaml_file, wbs_filename, "pdf"),
+            executor.submit(create_wbs_from_yaml, yaml_file, wbs_filename, "png"),
+            executor.submit(create_ram_diagram, yaml_file, ram_filename, "pdf"),
+            executor.submit(create_ram_diagram, yaml_file, ram_filename, "png")
+        ]
+        for future in futures:
+            future.result()
     
     # Export to Excel
-    export_to_excel(all_items, excel_filename) 
\ No newline at end of file
+    export_to_excel(all_items, excel_filename, totals) 
\ No newline at end of file
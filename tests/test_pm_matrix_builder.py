@@ -0,0 +1,95 @@
+import os
+
+import pytest
+import yaml
+
+import pm_matrix_builder
+
+# A WBS whose phase and task names load from YAML as numbers
+NUMERIC_KEYS_YAML = """
+project:
+  name: "Numeric"
+  2024:
+    1.0:
+      responsibilities:
+        project_manager: "L"
+        hardware: ""
+        software: ""
+        testing: ""
+        sponsor: ""
+        other: ""
+      duration: 2
+      labor: 16
+    2.5:
+      responsibilities:
+        project_manager: ""
+        hardware: "P"
+        software: ""
+        testing: ""
+        sponsor: ""
+        other: ""
+      duration: 1
+      labor: 8
+  Phase B:
+    Task:
+      responsibilities:
+        project_manager: "R"
+        hardware: "L"
+        software: ""
+        testing: ""
+        sponsor: ""
+        other: ""
+      duration: 1
+      labor: 8
+"""
+
+
+def test_flatten_wbs_numeric_task_keys():
+    yaml_data = yaml.safe_load(NUMERIC_KEYS_YAML)
+    wbs_structure = pm_matrix_builder.convert_yaml_to_wbs_format(yaml_data)
+
+    labels, parent_idx, levels, numbers = pm_matrix_builder._flatten_wbs(wbs_structure)
+
+    assert labels == ["Numeric", "2024", "1.0", "2.5", "Phase B", "Task"]
+    assert parent_idx == [-1, 0, 1, 1, 0, 4]
+    assert levels == [0, 1, 2, 2, 1, 2]
+    assert numbers == ["", "1.0", "1.1", "1.2", "2.0", "2.1"]
+
+    flat_wbs = (labels, parent_idx, levels, numbers)
+    statements = b"".join(pm_matrix_builder._iter_wbs_statements(flat_wbs, pm_matrix_builder.WBSColors.PALETTE))
+    assert b'label="2024 (1.0)"' in statements
+    assert b'label="1.0 (1.1)"' in statements
+
+
+def test_wbs_cache_follows_yaml_contents(tmp_path):
+    yaml_file = tmp_path / "wbs.yaml"
+    yaml_file.write_text(NUMERIC_KEYS_YAML)
+    cache_file = tmp_path / "wbs.yaml.wbs.json"
+
+    labels = pm_matrix_builder._load_or_build_wbs(str(yaml_file))[0]
+    assert labels == ["Numeric", "2024", "1.0", "2.5", "Phase B", "Task"]
+    assert cache_file.exists()
+
+    # An edit that keeps the modification time must still be picked up
+    stat = yaml_file.stat()
+    yaml_file.write_text(NUMERIC_KEYS_YAML.replace("Phase B", "Phase C"))
+    os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert pm_matrix_builder._load_or_build_wbs(str(yaml_file))[0][4] == "Phase C"
+
+    # A corrupt cache is rebuilt rather than raised
+    cache_file.write_bytes(b"\x80not json")
+    assert pm_matrix_builder._load_or_build_wbs(str(yaml_file))[0][4] == "Phase C"
+
+
+@pytest.mark.parametrize("backend", ["xlsxwriter", "pyexcelerate"])
+def test_export_to_excel_numeric_keys(tmp_path, backend):
+    openpyxl = pytest.importorskip("openpyxl")
+    all_items = pm_matrix_builder.extract_items(yaml.safe_load(NUMERIC_KEYS_YAML))
+
+    output = tmp_path / "project_data"
+    pm_matrix_builder.export_to_excel(all_items, str(output), backend=backend)
+
+    workbook = openpyxl.load_workbook(f"{output}.xlsx")
+    assert workbook.sheetnames == ["WBS", "RAM"]
+    names = [row[0] for row in workbook["RAM"].iter_rows(min_row=2, max_col=1, values_only=True)]
+    assert names[:len(all_items)] == ["    " * item['level'] + str(item['name']) for item in all_items]